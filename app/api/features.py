@@ -6,3 +6,16 @@ def load_daily(session_id: str) -> pd.DataFrame:
 
 def load_meals(session_id: str) -> pd.DataFrame:
     return session_data[session_id]["meals"]
+
+def session_memo(session_id: str, key: str, compute):
+    """Compute a derived result once per session. Session data never changes under a session_id
+    (re-ingesting creates a new id), so the id itself is the cache version."""
+    memo = session_data[session_id].setdefault("memo", {})
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+def session_memo_lookup(session_id: str, key: str):
+    """A result stored by session_memo, or None when it has not been computed (or the session is unknown)."""
+    entry = session_data.get(session_id)
+    return entry.get("memo", {}).get(key) if entry else None
@@ -145,9 +145,8 @@ async def validate_file_format(file_content: str):
     Validate file format before processing
     """
     try:
-        # Decode base64 content
-        decoded = base64.b64decode(file_content)
-        df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+        # Decode base64 content; pandas reads the bytes directly (no intermediate str copy)
+        df = pd.read_csv(io.BytesIO(base64.b64decode(file_content)), encoding='utf-8')
         
         # Basic validation
         validation_result = {
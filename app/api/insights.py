@@ -1,6 +1,10 @@
-from fastapi import APIRouter
+import asyncio
+from urllib.parse import quote
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 import pandas as pd
-from app.api.features import load_daily, load_meals
+from app.api.features import load_daily, load_meals, session_memo, session_memo_lookup
 from app.ml.glycemic import add_meal_features
 from app.ml.causal import doubly_robust_ate
 from app.ml.anomalies import anomaly_runs
@@ -16,10 +20,49 @@ from app.config import (
     CONFIDENCE_DAYS_MODERATE,
 )
 
+try:
+    import orjson  # noqa: F401  (optional: same encoder as the app's default response class)
+    from fastapi.responses import ORJSONResponse as _JSONRenderer
+except ImportError:
+    from fastapi.responses import JSONResponse as _JSONRenderer
+
 router = APIRouter()
 
+
+def _render_json(payload) -> bytes:
+    """Encode a payload exactly as the app's default response class would."""
+    return _JSONRenderer(jsonable_encoder(payload)).body
+
+
+def _session_etag(session_id: str, key: str) -> str:
+    """ETag for a session's payload: session data never changes under an id, so key + id identify the body."""
+    return f'"{quote(key, safe=":,")}-{session_id}"'
+
+
+def _json_body_response(body: bytes, etag: str, request: Request | None = None) -> Response:
+    """The encoded body with its ETag, or an empty 304 when the client already holds that version."""
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _memo_response(session_id: str, key: str, build, request: Request | None = None):
+    """Serve a session's payload from its already-encoded JSON body. Session data never changes
+    under a session_id, so repeat requests skip both the computation and the encoding, and a client
+    sending back the ETag gets a bodyless 304. Unknown sessions get build()'s empty fallback, uncached."""
+    try:
+        body = session_memo(session_id, f"json:{key}", lambda: _render_json(build()))
+    except KeyError:
+        return build()
+    return _json_body_response(body, _session_etag(session_id, key), request)
+
+
 @router.get("/timeline")
-def timeline(session_id: str):
+def timeline(session_id: str, request: Request):
+    return _memo_response(session_id, "timeline", lambda: timeline_payload(session_id), request)
+
+
+def timeline_payload(session_id: str):
     try:
         df = load_daily(session_id)
         return {
@@ -39,28 +82,125 @@ def timeline(session_id: str):
             "fg_fast_mgdl": [],
         }
 
+# Exported meal columns, in output order (base columns first, then the optional glycemic ones)
+MEAL_COLUMNS = ("date", "time", "carbs_g", "protein_g", "fat_g", "fiber_g", "carbs_pct",
+                "late_meal", "post_meal_walk10", "meal_auc", "meal_peak", "ttpeak_min")
+
+
+def meals_frame(session_id: str, fields: str | None = None, sort: str | None = None) -> pd.DataFrame:
+    """Meal rows with glycemic features, sorted by date/time and restricted to the exported columns.
+    sort ("column" or "column:desc") reorders by one column first, keeping date/time order within ties.
+    Raises KeyError when the session has no data."""
+    m = add_meal_features(load_meals(session_id))
+    sort_cols = [c for c in ["date", "time"] if c in m.columns]
+    if sort_cols:
+        m = m.sort_values(sort_cols)
+    if sort:
+        col, _, direction = sort.partition(":")
+        if col in m.columns:
+            m = m.sort_values(col, ascending=direction != "desc", kind="stable")
+    cols = [c for c in MEAL_COLUMNS if c in m.columns]
+    if fields:
+        wanted = {f.strip() for f in fields.split(",")}
+        cols = [c for c in cols if c in wanted]
+    return m[cols]
+
+
 @router.get("/meals")
-def meals(session_id: str):
+def meals(request: Request, session_id: str, page: int | None = None, size: int | None = None, fields: str | None = None, sort: str | None = None):
+    """Meal rows sorted by date/time (or by sort, see meals_frame). Optional page/size slice and
+    comma-separated field projection so the dashboard only transfers the rows and columns it displays."""
+    # fields and sort are client strings: reduce them to known columns so the per-session memo
+    # holds one entry per distinct result rather than one per spelling
+    if fields:
+        wanted = {f.strip() for f in fields.split(",")}
+        fields = ",".join(c for c in MEAL_COLUMNS if c in wanted)
+        if not fields:
+            return {"meals": [], "total": 0}
+    if sort:
+        col, _, direction = sort.partition(":")
+        sort = f"{col}:{'desc' if direction == 'desc' else 'asc'}" if col in MEAL_COLUMNS else None
+    # page and size too: slice only when both are given, and clamp to the pages that exist
+    if size is not None and size < 1:
+        raise HTTPException(status_code=400, detail="size must be at least 1")
+    if page is None or size is None:
+        page = size = None
+    else:
+        try:
+            total = len(_meals_sorted(session_id, fields, sort))
+        except KeyError:
+            return {"meals": [], "total": 0}
+        size = min(size, max(total, 1))
+        page = min(max(page, 0), max(-(-total // size) - 1, 0))
+    return _memo_response(session_id, f"meals:{page}:{size}:{fields}:{sort}", lambda: meals_payload(session_id, page, size, fields, sort), request)
+
+
+def _meals_sorted(session_id: str, fields: str | None, sort: str | None) -> pd.DataFrame:
+    """meals_frame memoized per session, so every page is a slice of one sorted frame."""
+    return session_memo(session_id, f"meals_frame:{fields}:{sort}", lambda: meals_frame(session_id, fields, sort))
+
+
+def meals_payload(session_id: str, page: int | None = None, size: int | None = None, fields: str | None = None, sort: str | None = None):
     try:
-        m = add_meal_features(load_meals(session_id))
-        sort_cols = [c for c in ["date", "time"] if c in m.columns]
-        if sort_cols:
-            m = m.sort_values(sort_cols)
-        base_cols = ["date", "time", "carbs_g", "protein_g", "fat_g", "fiber_g", "carbs_pct"]
-        optional_cols = ["late_meal", "post_meal_walk10", "meal_auc", "meal_peak", "ttpeak_min"]
-        cols = [c for c in base_cols if c in m.columns] + [c for c in optional_cols if c in m.columns]
-        if not cols:
-            return {"meals": []}
-        return {"meals": m[cols].astype(str).to_dict(orient="records")}
+        m = _meals_sorted(session_id, fields, sort)
+        if m.columns.empty:
+            return {"meals": [], "total": 0}
+        total = len(m)
+        if page is not None and size and size > 0:
+            start = max(page, 0) * size
+            m = m.iloc[start:start + size]
+        return {"meals": m.astype(str).to_dict(orient="records"), "total": total}
     except KeyError:
-        return {"meals": []}
+        return {"meals": [], "total": 0}
+
+
+CSV_CHUNK_ROWS = 10_000
+
+
+def _iter_csv(df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS):
+    """Yield a frame as CSV text one block of rows at a time, header on the first block only."""
+    if df.empty:
+        yield df.to_csv(index=False)
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0)
+
+
+@router.get("/meals.csv")
+def meals_csv(session_id: str, request: Request):
+    """Meal rows streamed as CSV, so a download never holds the whole file in memory.
+    A session's meals never change, so the session id is the ETag and repeat downloads get a 304."""
+    try:
+        load_meals(session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No session data")
+    etag = f'"meals-{session_id}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return StreamingResponse(
+        _iter_csv(meals_frame(session_id)),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="meals.csv"', "ETag": etag},
+    )
+
+
+@router.get("/meals/count")
+def meals_count(session_id: str):
+    try:
+        return {"count": len(load_meals(session_id))}
+    except KeyError:
+        return {"count": 0}
 
 # Daily columns required for insights (meal cols come from config.INSIGHTS_MEAL_COLS)
 INSIGHTS_DAILY_COLS = {"date", "sleep_hours", "hrv", "rhr", "fg_fast_mgdl"}
 
 
 @router.get("/insights")
-def insights(session_id: str):
+def insights(session_id: str, request: Request):
+    return _memo_response(session_id, "insights", lambda: insights_payload(session_id), request)
+
+
+def insights_payload(session_id: str):
     try:
         daily = load_daily(session_id)
         meals = add_meal_features(load_meals(session_id))
@@ -376,8 +516,7 @@ def predictions(session_id: str):
 @router.get("/correlations")
 def correlations(session_id: str):
     try:
-        daily = load_daily(session_id)
-        meals = add_meal_features(load_meals(session_id))
+        return session_memo(session_id, "correlations", lambda: _compute_correlations(session_id))
     except KeyError:
         return {
             "hidden_correlations": [],
@@ -385,10 +524,73 @@ def correlations(session_id: str):
             "error": "No session data",
             "message": "Load demo data or upload your files first.",
         }
-    hidden_correlations = discover_hidden_correlations(daily, meals)
-    lag_correlations = find_lag_correlations(daily)
+
+
+def _compute_correlations(session_id: str):
+    daily = load_daily(session_id)
+    meals = add_meal_features(load_meals(session_id))
     return {
-        "hidden_correlations": hidden_correlations,
-        "lag_correlations": lag_correlations,
+        "hidden_correlations": discover_hidden_correlations(daily, meals),
+        "lag_correlations": find_lag_correlations(daily),
     }
 
+
+# Dashboard bundle sections and the handler that builds each one
+_BUNDLE_HANDLERS = {
+    "timeline": timeline_payload,
+    "meals_count": lambda sid: meals_count(sid)["count"],
+    "insights": insights_payload,
+    "health_score": health_score,
+    "predictions": predictions,
+    "correlations": correlations,
+}
+# Sections sent when none are requested: the payloads of the tabs the dashboard mounts. Health
+# score and correlations have no tab yet, so they are only built when asked for by name.
+_DEFAULT_SECTIONS = ("timeline", "meals_count", "insights", "predictions")
+
+
+def _bundle_section(session_id: str, name: str):
+    """One dashboard section, built once per session and kept with it (sessions are immutable)."""
+    build = lambda: jsonable_encoder(_BUNDLE_HANDLERS[name](session_id))
+    try:
+        return session_memo(session_id, f"dashboard:{name}", build)
+    except KeyError:
+        return build()
+
+
+async def _gather_bundle(session_id: str, names=None) -> dict:
+    """Build the dashboard sections (the default set unless named) concurrently in worker threads; the insights section may wait on the LLM."""
+    names = list(names or _DEFAULT_SECTIONS)
+    results = await asyncio.gather(*(asyncio.to_thread(_bundle_section, session_id, n) for n in names))
+    return dict(zip(names, results))
+
+
+@router.get("/dashboard")
+async def dashboard(session_id: str, request: Request, sections: str | None = None):
+    """The dashboard tabs' payloads for a session in one response, so the dashboard needs a single round trip.
+    Each section and the encoded full bundle are kept with the session, like the single-section endpoints.
+    `sections` (comma-separated, e.g. "health_score,predictions") returns just those sections instead."""
+    if sections:
+        names = [n.strip() for n in sections.split(",") if n.strip()]
+        unknown = [n for n in names if n not in _BUNDLE_HANDLERS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown sections: {', '.join(unknown)}")
+        return await _gather_bundle(session_id, names)
+    body = session_memo_lookup(session_id, "json:dashboard")
+    if body is None:
+        bundle = await _gather_bundle(session_id)
+        try:
+            body = session_memo(session_id, "json:dashboard", lambda: _render_json(bundle))
+        except KeyError:
+            return bundle
+    return _json_body_response(body, _session_etag(session_id, "dashboard"), request)
+
+
+def dashboard_payload(session_id: str, names=None) -> dict:
+    """/api/dashboard sections (the default set unless named) as JSON-compatible objects for in-process
+    callers (the Dash app is mounted in this process). Shares the per-session sections with the HTTP endpoint."""
+    names = list(names or _DEFAULT_SECTIONS)
+    sections = {n: session_memo_lookup(session_id, f"dashboard:{n}") for n in names}
+    if None in sections.values():
+        sections = asyncio.run(_gather_bundle(session_id, names))
+    return sections
@@ -1,3 +1,4 @@
+import heapq
 import pandas as pd
 import numpy as np
 from scipy.stats import spearmanr, pearsonr
@@ -14,7 +15,7 @@ def corr_with_p(x: pd.Series, y: pd.Series, method: str = "spearman"):
         r, p = spearmanr(x[mask], y[mask])
     return float(r), float(p), int(mask.sum())
 
-def discover_hidden_correlations(daily: pd.DataFrame, meals: pd.DataFrame, min_correlation: float = 0.3) -> List[Dict]:
+def discover_hidden_correlations(daily: pd.DataFrame, meals: pd.DataFrame, min_correlation: float = 0.3, top_n: int = 10) -> List[Dict]:
     """
     Discover non-obvious correlations between health metrics
     """
@@ -65,10 +66,8 @@ def discover_hidden_correlations(daily: pd.DataFrame, meals: pd.DataFrame, min_c
                 "actionable": _is_actionable_correlation(metric1, metric2)
             })
     
-    # Sort by correlation strength and prioritize hidden correlations
-    correlations.sort(key=lambda x: (x['is_hidden'], abs(x['correlation'])), reverse=True)
-    
-    return correlations[:10]  # Return top 10
+    # Top correlations by strength, hidden correlations first (partial heap selection, no full sort)
+    return heapq.nlargest(top_n, correlations, key=lambda x: (x['is_hidden'], abs(x['correlation'])))
 
 def _is_hidden_correlation(metric1: str, metric2: str) -> bool:
     """Determine if correlation is non-obvious"""
@@ -105,7 +104,7 @@ def _is_actionable_correlation(metric1: str, metric2: str) -> bool:
     actionable_metrics = ['sleep_hours', 'late_meal', 'post_meal_walk10', 'fiber_g', 'workout_min']
     return any(m in actionable_metrics for m in [metric1, metric2])
 
-def find_lag_correlations(daily: pd.DataFrame, max_lag: int = 3) -> List[Dict]:
+def find_lag_correlations(daily: pd.DataFrame, max_lag: int = 3, top_n: int | None = None) -> List[Dict]:
     """
     Find correlations with time lags (e.g., sleep affects next day's glucose)
     """
@@ -119,23 +118,28 @@ def find_lag_correlations(daily: pd.DataFrame, max_lag: int = 3) -> List[Dict]:
         ('steps', 'hrv', 'Activity affects next day HRV')
     ]
     
+    # Sort once and work on plain float arrays: a lag is just an offset slice, so no per-lag
+    # shifted column is added to (and copied with) the frame.
+    daily_sorted = daily.sort_values('date')
+
     for predictor, outcome, description in relationships:
-        if predictor not in daily.columns or outcome not in daily.columns:
+        if predictor not in daily_sorted.columns or outcome not in daily_sorted.columns:
             continue
-            
-        daily_sorted = daily.sort_values('date').copy()
-        
-        for lag in range(1, max_lag + 1):
-            # Create lagged predictor
-            daily_sorted[f'{predictor}_lag{lag}'] = daily_sorted[predictor].shift(lag)
-            
-            # Calculate correlation
-            r, p, n = corr_with_p(
-                daily_sorted[f'{predictor}_lag{lag}'], 
-                daily_sorted[outcome]
-            )
-            
-            if r is not None and abs(r) >= 0.3 and p < 0.05 and n >= 15:
+
+        x = daily_sorted[predictor].to_numpy(dtype=float)
+        y = daily_sorted[outcome].to_numpy(dtype=float)
+
+        for lag in range(1, min(max_lag, len(x) - 1) + 1):
+            # predictor from `lag` days earlier paired with today's outcome
+            xl, yl = x[:-lag], y[lag:]
+            mask = ~(np.isnan(xl) | np.isnan(yl))
+            n = int(mask.sum())
+            if n < 15:
+                continue
+            r, p = spearmanr(xl[mask], yl[mask])
+            r, p = float(r), float(p)
+
+            if abs(r) >= 0.3 and p < 0.05:
                 lag_correlations.append({
                     "predictor": predictor,
                     "outcome": outcome,
@@ -147,4 +151,6 @@ def find_lag_correlations(daily: pd.DataFrame, max_lag: int = 3) -> List[Dict]:
                     "interpretation": f"{predictor} from {lag} day(s) ago {description.lower()}"
                 })
     
+    if top_n is not None:
+        return heapq.nlargest(top_n, lag_correlations, key=lambda x: abs(x['correlation']))
     return sorted(lag_correlations, key=lambda x: abs(x['correlation']), reverse=True)
@@ -1,84 +1,97 @@
 import pandas as pd, numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from pathlib import Path
 from datetime import datetime, timedelta
 
 DEMO = Path(__file__).resolve().parents[1] / "app" / "data" / "demo"
 DEMO.mkdir(parents=True, exist_ok=True)
 
-np.random.seed(42)
+rng = np.random.default_rng(42)
+
+
+def write_csv(df, name):
+    """Write a demo CSV with Arrow's C++ writer (pandas formats every cell in Python); strings are only
+    quoted when they need it, so the files read exactly like pandas-written ones"""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), DEMO / name,
+                    write_options=pacsv.WriteOptions(quoting_style="needed"))
 
 days = 90
 start = datetime.today().date() - timedelta(days=days)
 dates = [start + timedelta(days=i) for i in range(days)]
 
 # Sleep / HRV / RHR
-sleep_hours = np.clip(np.random.normal(7.1, 1.0, days), 4.0, 9.5)
-hrv = np.clip(np.random.normal(45, 8, days) + 0.6*(sleep_hours-7), 20, 80)
-rhr = np.clip(np.random.normal(60, 4, days) - 0.5*(sleep_hours-7), 50, 80)
+sleep_hours = np.clip(rng.normal(7.1, 1.0, days), 4.0, 9.5)
+hrv = np.clip(rng.normal(45, 8, days) + 0.6*(sleep_hours-7), 20, 80)
+rhr = np.clip(rng.normal(60, 4, days) - 0.5*(sleep_hours-7), 50, 80)
 
 sleep_df = pd.DataFrame({"date": dates, "sleep_hours": sleep_hours.round(2), "hrv": hrv.round(1), "rhr": rhr.round(1)})
-sleep_df.to_csv(DEMO / "sleep.csv", index=False)
+write_csv(sleep_df, "sleep.csv")
 
 # Activity
-steps = np.clip(np.random.normal(8500, 2500, days), 1500, 18000)
-workout_min = np.clip(np.random.normal(25, 20, days), 0, 120)
-hydration_l = np.clip(np.random.normal(2.2, 0.6, days), 0.8, 4.0)
+steps = np.clip(rng.normal(8500, 2500, days), 1500, 18000)
+workout_min = np.clip(rng.normal(25, 20, days), 0, 120)
+hydration_l = np.clip(rng.normal(2.2, 0.6, days), 0.8, 4.0)
 activity_df = pd.DataFrame({"date": dates, "steps": steps.astype(int), "workout_min": workout_min.astype(int), "hydration_l": hydration_l.round(2)})
-activity_df.to_csv(DEMO / "activity.csv", index=False)
+write_csv(activity_df, "activity.csv")
 
 # Vitals — fasting glucose, with a mild sickness window
-fg = np.clip(np.random.normal(95, 5, days), 80, 115)
-sick_start = np.random.randint(20, 60)
+fg = np.clip(rng.normal(95, 5, days), 80, 115)
+sick_start = rng.integers(20, 60)
 fg[sick_start:sick_start+4] += 6
 vitals_df = pd.DataFrame({"date": dates, "fg_fast_mgdl": fg.round(1)})
-vitals_df.to_csv(DEMO / "vitals.csv", index=False)
-
-# Meals — 2-3 per day
-rows = []
-for d in dates:
-    n = np.random.choice([2,3], p=[0.4,0.6])
-    for i in range(n):
-        hour = np.random.choice([8,12,19,21], p=[0.3,0.35,0.25,0.10])
-        minute = np.random.choice([0,15,30,45])
-        time = f"{hour:02d}:{minute:02d}"
-        late_meal = 1 if hour >= 21 else 0
-        carbs = np.clip(np.random.normal(60, 25), 10, 140)
-        protein = np.clip(np.random.normal(25, 12), 5, 70)
-        fat = np.clip(np.random.normal(20, 10), 3, 60)
-        fiber = np.clip(np.random.normal(7, 3), 1, 20)
-        # behavior: 10-min post-meal walk more likely on lunch/dinner
-        post_walk = np.random.choice([0,1], p=[0.6,0.4]) if hour in [12,19] else np.random.choice([0,1], p=[0.8,0.2])
-
-        # glycemic response (AUC/peak) — simple generative rules
-        total = carbs + protein + fat
-        carbs_pct = carbs / max(total, 1e-6)
-
-        # base
-        auc = 60 + 0.6*carbs + 0.2*(carbs_pct*100) - 1.5*fiber
-        peak = 105 + 0.25*carbs - 1.0*fiber
-
-        # penalties / benefits
-        # previous night sleep effect will be applied downstream; add mild noise here
-        if late_meal: 
-            auc *= 1.10
-            peak += 10
-        if post_walk:
-            auc *= 0.88
-            peak -= 8
-
-        # noise
-        auc += np.random.normal(0, 8)
-        peak += np.random.normal(0, 6)
-
-        ttpeak = int(np.clip(np.random.normal(55, 10), 30, 90))
-
-        rows.append({
-            "date": d, "time": time, "carbs_g": round(carbs,1), "protein_g": round(protein,1), "fat_g": round(fat,1),
-            "fiber_g": round(fiber,1), "late_meal": late_meal, "post_meal_walk10": post_walk,
-            "meal_auc": round(max(20, auc),1), "meal_peak": round(max(85, peak),1), "ttpeak_min": ttpeak
-        })
-
-meals_df = pd.DataFrame(rows).sort_values(["date","time"])
-meals_df.to_csv(DEMO / "meals.csv", index=False)
+write_csv(vitals_df, "vitals.csv")
+
+# Meals — 2-3 per day, every meal drawn at once as whole-array ops
+n_per_day = rng.choice([2,3], size=days, p=[0.4,0.6])
+n_meals = int(n_per_day.sum())
+day_idx = np.repeat(np.arange(days), n_per_day)
+meal_dates = np.array(dates, dtype=object)[day_idx]
+
+hour = rng.choice([8,12,19,21], size=n_meals, p=[0.3,0.35,0.25,0.10])
+minute = rng.choice([0,15,30,45], size=n_meals)
+# Minutes since midnight order the meals; the HH:MM string is only formatted for the CSV
+time_key = hour*60 + minute
+time = pd.Series(hour).map("{:02d}".format) + ":" + pd.Series(minute).map("{:02d}".format)
+late_meal = (hour >= 21).astype(int)
+carbs = np.clip(rng.normal(60, 25, n_meals), 10, 140)
+protein = np.clip(rng.normal(25, 12, n_meals), 5, 70)
+fat = np.clip(rng.normal(20, 10, n_meals), 3, 60)
+fiber = np.clip(rng.normal(7, 3, n_meals), 1, 20)
+# behavior: 10-min post-meal walk more likely on lunch/dinner
+walk_p = np.where(np.isin(hour, [12,19]), 0.4, 0.2)
+post_walk = (rng.random(n_meals) < walk_p).astype(int)
+
+# glycemic response (AUC/peak) — simple generative rules, updated in place to keep temporaries down
+total = carbs + protein + fat
+np.maximum(total, 1e-6, out=total)
+
+# base: 0.6*carbs + 0.2*(carbs share in %) folds into carbs * (0.6 + 20/total)
+auc = np.divide(20, total, out=total)
+auc += 0.6
+auc *= carbs
+auc += 60 - 1.5*fiber
+peak = 105 + 0.25*carbs - fiber
+
+# penalties / benefits
+# previous night sleep effect will be applied downstream; add mild noise here
+auc *= np.where(late_meal, 1.10, 1.0) * np.where(post_walk, 0.88, 1.0)
+peak += 10*late_meal - 8*post_walk
+
+# noise
+auc += rng.normal(0, 8, n_meals)
+peak += rng.normal(0, 6, n_meals)
+
+ttpeak = np.clip(rng.normal(55, 10, n_meals), 30, 90).astype(int)
+
+# Typed columns straight from the arrays: 1-decimal values fit float32 (Arrow writes its shortest
+# round-trip form, e.g. 60.3) and the flags / minutes fit small ints
+f32 = lambda a: a.round(1).astype(np.float32)
+meals_df = pd.DataFrame({
+    "date": meal_dates, "time": time, "carbs_g": f32(carbs), "protein_g": f32(protein), "fat_g": f32(fat),
+    "fiber_g": f32(fiber), "late_meal": late_meal.astype(np.int8), "post_meal_walk10": post_walk.astype(np.int8),
+    "meal_auc": f32(np.maximum(20, auc)), "meal_peak": f32(np.maximum(85, peak)), "ttpeak_min": ttpeak.astype(np.int16)
+}).iloc[np.lexsort((time_key, day_idx))]  # by day, then time of day, on integer keys
+write_csv(meals_df, "meals.csv")
 
 print("Synthetic CSVs written to", DEMO)